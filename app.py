@@ -1,8 +1,40 @@
 import streamlit as st
+import io
+import json
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for Streamlit
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+
+# Chart styling, scoped to the sequence plot via plt.rc_context
+PLOT_STYLE = {
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+}
+
+# Display labels and identifiers for each sequence type, keyed on is_arith
+SEQUENCE_LABELS = {
+    True: {
+        "sequence_type": "Arithmetic Sequence",
+        "param_label": "Common Difference",
+        "param_symbol": "d",
+        "param_key": "common_difference",
+        "file_prefix": "arithmetic",
+    },
+    False: {
+        "sequence_type": "Geometric Sequence",
+        "param_label": "Common Ratio",
+        "param_symbol": "r",
+        "param_key": "common_ratio",
+        "file_prefix": "geometric",
+    },
+}
 
 def generate_arithmetic_sequence(first_term, common_difference, num_terms):
     """
@@ -14,13 +46,9 @@ def generate_arithmetic_sequence(first_term, common_difference, num_terms):
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: A list containing the arithmetic sequence
+        numpy.ndarray: A float64 array containing the arithmetic sequence
     """
-    sequence = []
-    for i in range(num_terms):
-        term = first_term + (i * common_difference)
-        sequence.append(term)
-    return sequence
+    return first_term + np.arange(num_terms, dtype=np.float64) * common_difference
 
 def generate_geometric_sequence(first_term, common_ratio, num_terms):
     """
@@ -32,13 +60,178 @@ def generate_geometric_sequence(first_term, common_ratio, num_terms):
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: A list containing the geometric sequence
+        numpy.ndarray: A float64 array containing the geometric sequence
+    """
+    exponents = np.arange(num_terms)
+    return first_term * np.power(common_ratio, exponents, dtype=np.float64)
+
+def sequence_summary(sequence, first_term, param_value, num_terms, is_arith):
+    """
+    Compute the last term and the sum of a generated sequence.
+    
+    Arithmetic sequences use the exact closed form. Geometric sequences are summed
+    from the generated terms so the result matches the values on screen; a sum
+    too large for a float comes out as inf rather than raising.
+    
+    Args:
+        sequence (numpy.ndarray): The generated terms
+        first_term (float): The first term of the sequence
+        param_value (float): The common difference (arithmetic) or common ratio (geometric)
+        num_terms (int): The number of terms in the sequence
+        is_arith (bool): True for an arithmetic sequence, False for a geometric one
+    
+    Returns:
+        tuple: The last term (aₙ) and the sum of all terms (Sₙ)
+    """
+    if is_arith:
+        last_term = first_term + (num_terms - 1) * param_value
+        sequence_sum = num_terms * (2 * first_term + (num_terms - 1) * param_value) / 2
+    else:
+        last_term = float(sequence[-1])
+        sequence_sum = float(sequence.sum())
+    return last_term, sequence_sum
+
+def format_sequence(values):
+    """
+    Format sequence terms as a comma-separated string.
+    
+    Args:
+        values (numpy.ndarray): The terms to format
+    
+    Returns:
+        str: The terms joined with ", "
+    """
+    return ", ".join(map(str, values.tolist()))
+
+@st.cache_data(max_entries=32)
+def build_sequence(first_term, param_value, num_terms, is_arith):
+    """
+    Generate the requested sequence, memoized across Streamlit reruns.
+    
+    The other cached builders take these same four arguments, which form their cache key.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        param_value (float): The common difference (arithmetic) or common ratio (geometric)
+        num_terms (int): The number of terms to generate
+        is_arith (bool): True for an arithmetic sequence, False for a geometric one
+    
+    Returns:
+        numpy.ndarray: A float64 array containing the sequence
     """
-    sequence = []
-    for i in range(num_terms):
-        term = first_term * (common_ratio ** i)
-        sequence.append(term)
-    return sequence
+    if is_arith:
+        return generate_arithmetic_sequence(first_term, param_value, num_terms)
+    return generate_geometric_sequence(first_term, param_value, num_terms)
+
+@st.cache_data(max_entries=32)
+def build_sequence_table(first_term, param_value, num_terms, is_arith):
+    """
+    Build the term number / term value table for the requested sequence.
+    
+    Returns:
+        pandas.DataFrame: A table with one row per term
+    """
+    sequence = build_sequence(first_term, param_value, num_terms, is_arith)
+    return pd.DataFrame({
+        'Term Number (n)': np.arange(1, len(sequence) + 1, dtype=np.int32),
+        'Term Value (aₙ)': np.asarray(sequence, dtype=np.float64)
+    })
+
+@st.cache_data(max_entries=32)
+def build_csv_export(first_term, param_value, num_terms, is_arith):
+    """
+    Serialize the sequence table as CSV, memoized across Streamlit reruns.
+    
+    Returns:
+        str: The CSV file contents
+    """
+    df = build_sequence_table(first_term, param_value, num_terms, is_arith)
+    return df.to_csv(index=False)
+
+@st.cache_data(max_entries=32)
+def build_text_export(first_term, param_value, num_terms, is_arith):
+    """
+    Serialize the sequence as plain text, memoized across Streamlit reruns.
+    
+    Returns:
+        str: The text file contents
+    """
+    sequence = build_sequence(first_term, param_value, num_terms, is_arith)
+    _, sequence_sum = sequence_summary(sequence, first_term, param_value, num_terms, is_arith)
+    labels = SEQUENCE_LABELS[is_arith]
+    
+    text_data = f"{labels['sequence_type']}\n"
+    text_data += f"First Term: {first_term}\n"
+    text_data += f"{labels['param_label']}: {param_value}\n"
+    text_data += f"Number of Terms: {num_terms}\n"
+    text_data += f"Sum: {sequence_sum}\n\n"
+    text_data += "Sequence: " + format_sequence(sequence)
+    return text_data
+
+@st.cache_data(max_entries=32)
+def build_json_export(first_term, param_value, num_terms, is_arith):
+    """
+    Serialize the sequence as JSON, memoized across Streamlit reruns.
+    
+    Returns:
+        str: The JSON file contents
+    """
+    sequence = build_sequence(first_term, param_value, num_terms, is_arith)
+    last_term, sequence_sum = sequence_summary(sequence, first_term, param_value, num_terms, is_arith)
+    labels = SEQUENCE_LABELS[is_arith]
+    
+    json_data = {
+        "sequence_type": labels["sequence_type"],
+        "parameters": {
+            "first_term": first_term,
+            labels["param_key"]: param_value,
+            "number_of_terms": num_terms
+        },
+        "sequence": sequence.tolist(),
+        "sum": sequence_sum,
+        "last_term": last_term
+    }
+    return json.dumps(json_data, indent=2)
+
+@st.cache_data(max_entries=32)
+def render_sequence_plot(first_term, param_value, num_terms, is_arith):
+    """
+    Render the sequence chart to PNG, memoized across Streamlit reruns.
+    
+    Returns:
+        bytes: The rendered chart as PNG image data
+    """
+    sequence = build_sequence(first_term, param_value, num_terms, is_arith)
+    labels = SEQUENCE_LABELS[is_arith]
+    
+    with plt.rc_context(PLOT_STYLE):
+        # Create the plot
+        fig, ax = plt.subplots(figsize=(12, 6))
+        
+        # Determine how many points to plot
+        plot_points = min(len(sequence), 100)  # Limit to 100 points for readability
+        x_values = np.arange(1, plot_points + 1, dtype=np.int32)
+        y_values = sequence[:plot_points]  # ndarray slice is a view, not a copy
+        
+        # Create scatter plot and line plot
+        ax.scatter(x_values, y_values, color='blue', s=50, alpha=0.7, zorder=3)
+        ax.plot(x_values, y_values, color='red', linewidth=2, alpha=0.8, zorder=2)
+        
+        # Customize the plot
+        ax.set_xlabel('Term Number (n)')
+        ax.set_ylabel('Term Value (aₙ)')
+        ax.set_title(f"{labels['sequence_type']}: a₁={first_term}, {labels['param_symbol']}={param_value}")
+        
+        # Show every nth x-tick to avoid crowding
+        if plot_points > 20:
+            tick_step = max(1, plot_points // 10)
+            ax.set_xticks(np.arange(1, plot_points + 1, tick_step))
+        
+        plt.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+        plt.close(fig)
+    return buffer.getvalue()
 
 def main():
     # Set page configuration
@@ -91,6 +284,7 @@ def main():
             )
     
     with col3:
+        # All-int bounds, value and step make Streamlit return an int, so no casts are needed below
         num_terms = st.number_input(
             "Number of Terms (n)",
             min_value=1,
@@ -103,19 +297,26 @@ def main():
     # Input validation and sequence generation
     if num_terms > 0:
         try:
-            # Generate the sequence based on type
-            if sequence_type == "Arithmetic Sequence":
-                sequence = generate_arithmetic_sequence(first_term, second_param, num_terms)
-            else:
-                sequence = generate_geometric_sequence(first_term, second_param, num_terms)
-            
             # Normalize variables for both sequence types
             is_arith = sequence_type.startswith("Arithmetic")
             param_value = second_param
-            param_symbol = "d" if is_arith else "r"
-            param_label = "Common Difference" if is_arith else "Common Ratio"
-            file_prefix = "arithmetic" if is_arith else "geometric"
-            param_key = "common_difference" if is_arith else "common_ratio"
+            labels = SEQUENCE_LABELS[is_arith]
+            param_symbol = labels["param_symbol"]
+            param_label = labels["param_label"]
+            p_fmt = f"({param_value})" if param_value < 0 else f"{param_value}"  # Parenthesize negatives in formulas
+            file_prefix = labels["file_prefix"]
+            
+            # Generate the sequence based on type
+            sequence = build_sequence(first_term, param_value, num_terms, is_arith)
+            n_seq = len(sequence)
+            last_term, sequence_sum = sequence_summary(sequence, first_term, param_value, num_terms, is_arith)
+            average_term = sequence_sum / num_terms
+            
+            # Create a table showing term number and value
+            df = build_sequence_table(first_term, param_value, num_terms, is_arith)
+            
+            # First few terms reuse the already generated values
+            preview = sequence[:5].tolist()
             
             # Enhanced Formula Display
             if is_arith:
@@ -127,23 +328,12 @@ def main():
                 
                 # Specific formula with values
                 st.subheader("Your Sequence Formula:")
-                if param_value >= 0:
-                    st.latex(f"a_n = {first_term} + (n-1) \\times {param_value}")
-                else:
-                    st.latex(f"a_n = {first_term} + (n-1) \\times ({param_value})")
+                st.latex(f"a_n = {first_term} + (n-1) \\times {p_fmt}")
                 
                 # Show first few terms with formula
                 st.subheader("First Few Terms:")
-                formula_examples = []
-                for i in range(1, min(6, int(num_terms) + 1)):
-                    term_value = first_term + (i-1) * param_value
-                    if param_value >= 0:
-                        formula_examples.append(f"a_{{{i}}} = {first_term} + ({i}-1) × {param_value} = {term_value}")
-                    else:
-                        formula_examples.append(f"a_{{{i}}} = {first_term} + ({i}-1) × ({param_value}) = {term_value}")
-                
-                for example in formula_examples:
-                    st.write(f"• {example}")
+                st.markdown("\n".join(f"- $a_{{{i}}} = {first_term} + ({i}-1) \\times {p_fmt} = {term_value}$"
+                                       for i, term_value in enumerate(preview, start=1)))
             else:
                 st.header("📐 Geometric Sequence Formulas")
                 
@@ -153,23 +343,12 @@ def main():
                 
                 # Specific formula with values
                 st.subheader("Your Sequence Formula:")
-                if param_value >= 0:
-                    st.latex(f"a_n = {first_term} \\times {param_value}^{{{{(n-1)}}}}")
-                else:
-                    st.latex(f"a_n = {first_term} \\times ({param_value})^{{{{(n-1)}}}}")
+                st.latex(f"a_n = {first_term} \\times {p_fmt}^{{{{(n-1)}}}}")
                 
                 # Show first few terms with formula
                 st.subheader("First Few Terms:")
-                formula_examples = []
-                for i in range(1, min(6, int(num_terms) + 1)):
-                    term_value = first_term * (param_value ** (i-1))
-                    if param_value >= 0:
-                        formula_examples.append(f"a_{{{i}}} = {first_term} × {param_value}^{{{i-1}}} = {term_value}")
-                    else:
-                        formula_examples.append(f"a_{{{i}}} = {first_term} × ({param_value})^{{{i-1}}} = {term_value}")
-                
-                for example in formula_examples:
-                    st.write(f"• {example}")
+                st.markdown("\n".join(f"- $a_{{{i}}} = {first_term} \\times {p_fmt}^{{{i-1}}} = {term_value}$"
+                                       for i, term_value in enumerate(preview, start=1)))
             
             # Display sequence information
             st.header("Sequence Information")
@@ -182,120 +361,60 @@ def main():
                 st.metric(param_label, f"{param_value}")
             
             with info_col3:
-                st.metric("Number of Terms", f"{int(num_terms)}")
+                st.metric("Number of Terms", f"{num_terms}")
             
             # Display the sequence
             st.header("Generated Sequence")
             
             # Show sequence as a formatted list
-            if len(sequence) <= 50:  # Show all terms if 50 or fewer
-                sequence_str = ", ".join([str(term) for term in sequence])
+            if n_seq <= 50:  # Show all terms if 50 or fewer
+                sequence_str = format_sequence(sequence)
                 st.write(f"**Sequence:** {sequence_str}")
             else:  # Show first 25 and last 25 terms if more than 50
                 first_part = sequence[:25]
                 last_part = sequence[-25:]
-                first_str = ", ".join([str(term) for term in first_part])
-                last_str = ", ".join([str(term) for term in last_part])
-                st.write(f"**First 25 terms:** {first_str}")
-                st.write("...")
-                st.write(f"**Last 25 terms:** {last_str}")
+                first_str = format_sequence(first_part)
+                last_str = format_sequence(last_part)
+                st.markdown(f"**First 25 terms:** {first_str}\n\n...\n\n**Last 25 terms:** {last_str}")
             
             # Add matplotlib visualization
             st.header("📊 Sequence Visualization")
             
-            # Create the plot
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Determine how many points to plot
-            plot_points = min(len(sequence), 100)  # Limit to 100 points for readability
-            x_values = list(range(1, plot_points + 1))
-            y_values = sequence[:plot_points]
-            
-            # Create scatter plot and line plot
-            ax.scatter(x_values, y_values, color='blue', s=50, alpha=0.7, zorder=3)
-            ax.plot(x_values, y_values, color='red', linewidth=2, alpha=0.8, zorder=2)
-            
-            # Customize the plot
-            ax.set_xlabel('Term Number (n)', fontsize=12)
-            ax.set_ylabel('Term Value (aₙ)', fontsize=12)
-            ax.set_title(f'{sequence_type}: a₁={first_term}, {param_symbol}={param_value}', fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            
-            # Add some styling
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
+            st.image(render_sequence_plot(first_term, param_value, num_terms, is_arith))
             
-            # Show every nth x-tick to avoid crowding
-            if plot_points > 20:
-                tick_step = max(1, plot_points // 10)
-                ax.set_xticks(range(1, plot_points + 1, tick_step))
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
-            
-            if len(sequence) > 100:
-                st.info(f"📝 Note: Chart shows first 100 terms. Your sequence has {len(sequence)} terms total.")
+            if n_seq > 100:
+                st.info(f"📝 Note: Chart shows first 100 terms. Your sequence has {n_seq} terms total.")
             
             # Download section
             st.header("Download Options")
             download_col1, download_col2, download_col3 = st.columns(3)
             
-            # Create a table showing term number and value
-            import pandas as pd
-            import json
-            
-            df = pd.DataFrame({
-                'Term Number (n)': range(1, len(sequence) + 1),
-                'Term Value (aₙ)': sequence
-            })
-            
             # Download as CSV
             with download_col1:
-                csv_data = df.to_csv(index=False)
                 st.download_button(
                     label="📄 Download CSV",
-                    data=csv_data,
-                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{int(num_terms)}.csv",
+                    data=build_csv_export(first_term, param_value, num_terms, is_arith),
+                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{num_terms}.csv",
                     mime="text/csv",
                     help="Download sequence as CSV file"
                 )
             
             # Download as Text
             with download_col2:
-                text_data = f"{sequence_type}\n"
-                text_data += f"First Term: {first_term}\n"
-                text_data += f"{param_label}: {param_value}\n"
-                text_data += f"Number of Terms: {int(num_terms)}\n"
-                text_data += f"Sum: {sum(sequence)}\n\n"
-                text_data += "Sequence: " + ", ".join([str(term) for term in sequence])
-                
                 st.download_button(
                     label="📝 Download Text",
-                    data=text_data,
-                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{int(num_terms)}.txt",
+                    data=build_text_export(first_term, param_value, num_terms, is_arith),
+                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{num_terms}.txt",
                     mime="text/plain",
                     help="Download sequence as text file"
                 )
             
             # Download as JSON
             with download_col3:
-                json_data = {
-                    "sequence_type": sequence_type,
-                    "parameters": {
-                        "first_term": first_term,
-                        param_key: param_value,
-                        "number_of_terms": int(num_terms)
-                    },
-                    "sequence": sequence,
-                    "sum": sum(sequence),
-                    "last_term": sequence[-1]
-                }
-                
                 st.download_button(
                     label="📊 Download JSON",
-                    data=json.dumps(json_data, indent=2),
-                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{int(num_terms)}.json",
+                    data=build_json_export(first_term, param_value, num_terms, is_arith),
+                    file_name=f"{file_prefix}_sequence_{first_term}_{param_value}_{num_terms}.json",
                     mime="application/json",
                     help="Download sequence as JSON file"
                 )
@@ -307,9 +426,6 @@ def main():
             # Enhanced Sum Information
             st.header(f"🧮 Sum of {sequence_type} (Sₙ)")
             
-            last_term = sequence[-1]
-            sequence_sum = sum(sequence)
-            
             # Display sum metrics
             sum_col1, sum_col2, sum_col3 = st.columns(3)
             with sum_col1:
@@ -317,9 +433,9 @@ def main():
                 st.caption("Sum of all terms")
             with sum_col2:
                 st.metric("Last Term (aₙ)", f"{last_term}")
-                st.caption(f"The {int(num_terms)}th term")
+                st.caption(f"The {num_terms}th term")
             with sum_col3:
-                st.metric("Average Term", f"{sequence_sum/num_terms:.2f}")
+                st.metric("Average Term", f"{average_term:.2f}")
                 st.caption("Mean of all terms")
             
             # Show sum formulas based on sequence type
@@ -332,64 +448,64 @@ def main():
                 
                 # Specific calculation with your values
                 st.write("**Your Sequence Calculation:**")
-                st.latex(f"S_{{{int(num_terms)}}} = \\frac{{{int(num_terms)}(a_1 + a_{{{int(num_terms)}}})}}{{2}} = \\frac{{{int(num_terms)}({first_term} + {last_term})}}{{2}} = {sequence_sum}")
+                st.latex(f"S_{{{num_terms}}} = \\frac{{{num_terms}(a_1 + a_{{{num_terms}}})}}{{2}} = \\frac{{{num_terms}({first_term} + {last_term})}}{{2}} = {sequence_sum}")
                 
                 # Alternative formula calculation
                 st.write("**Alternative Calculation:**")
-                alternative_calc = f"{int(num_terms)}(2 \\times {first_term} + ({int(num_terms)}-1) \\times {param_value})"
-                if param_value < 0:
-                    alternative_calc = f"{int(num_terms)}(2 \\times {first_term} + ({int(num_terms)}-1) \\times ({param_value}))"
-                st.latex(f"S_{{{int(num_terms)}}} = \\frac{{{alternative_calc}}}{{2}} = {sequence_sum}")
+                alternative_calc = f"{num_terms}(2 \\times {first_term} + ({num_terms}-1) \\times {p_fmt})"
+                st.latex(f"S_{{{num_terms}}} = \\frac{{{alternative_calc}}}{{2}} = {sequence_sum}")
             else:
                 # Geometric sequence sum formulas
                 st.write("**General Formula:**")
                 if param_value == 1:
                     st.latex(r"S_n = n \times a_1 \quad \text{(when r = 1)}")
                     st.write("**Your Sequence Calculation:**")
-                    st.latex(f"S_{{{int(num_terms)}}} = {int(num_terms)} \\times {first_term} = {sequence_sum}")
+                    st.latex(f"S_{{{num_terms}}} = {num_terms} \\times {first_term} = {sequence_sum}")
                 else:
                     st.latex(r"S_n = a_1 \times \frac{1 - r^n}{1 - r} \quad \text{(when r ≠ 1)}")
                     st.write("**Your Sequence Calculation:**")
-                    if param_value >= 0:
-                        st.latex(f"S_{{{int(num_terms)}}} = {first_term} \\times \\frac{{{{1 - {param_value}^{{{int(num_terms)}}}}}}}{{{{1 - {param_value}}}}} = {sequence_sum}")
-                    else:
-                        st.latex(f"S_{{{int(num_terms)}}} = {first_term} \\times \\frac{{{{1 - ({param_value})^{{{int(num_terms)}}}}}}}{{{{1 - ({param_value})}}}} = {sequence_sum}")
+                    st.latex(f"S_{{{num_terms}}} = {first_term} \\times \\frac{{{{1 - {p_fmt}^{{{num_terms}}}}}}}{{{{1 - {p_fmt}}}}} = {sequence_sum}")
             
             # Additional Information
             st.header("📋 Additional Information")
             info_col1, info_col2 = st.columns(2)
             
             with info_col1:
-                st.write("**Sequence Properties:**")
-                st.write(f"• First term (a₁): {first_term}")
-                st.write(f"• {param_label} ({param_symbol}): {param_value}")
-                st.write(f"• Number of terms (n): {int(num_terms)}")
-                
                 if is_arith:
                     if param_value > 0:
-                        st.write("• Type: Increasing sequence")
+                        sequence_kind = "Increasing sequence"
                     elif param_value < 0:
-                        st.write("• Type: Decreasing sequence")
+                        sequence_kind = "Decreasing sequence"
                     else:
-                        st.write("• Type: Constant sequence")
+                        sequence_kind = "Constant sequence"
                 else:
                     if param_value > 1:
-                        st.write("• Type: Increasing geometric sequence")
+                        sequence_kind = "Increasing geometric sequence"
                     elif param_value == 1:
-                        st.write("• Type: Constant sequence")
+                        sequence_kind = "Constant sequence"
                     elif 0 < param_value < 1:
-                        st.write("• Type: Decreasing geometric sequence")
+                        sequence_kind = "Decreasing geometric sequence"
                     elif param_value == 0:
-                        st.write("• Type: Zero sequence (after first term)")
+                        sequence_kind = "Zero sequence (after first term)"
                     else:
-                        st.write("• Type: Alternating geometric sequence")
+                        sequence_kind = "Alternating geometric sequence"
+                
+                properties = [
+                    f"First term (a₁): {first_term}",
+                    f"{param_label} ({param_symbol}): {param_value}",
+                    f"Number of terms (n): {num_terms}",
+                    f"Type: {sequence_kind}",
+                ]
+                st.markdown("**Sequence Properties:**\n\n" + "\n".join(f"- {line}" for line in properties))
             
             with info_col2:
-                st.write("**Calculated Values:**")
-                st.write(f"• Last term (a_{{{int(num_terms)}}}): {last_term}")
-                st.write(f"• Sum of sequence (S_{{{int(num_terms)}}}): {sequence_sum}")
-                st.write(f"• Average term: {sequence_sum/num_terms:.2f}")
-                st.write(f"• Range: {last_term - first_term}")
+                calculated_values = [
+                    f"Last term (a_{{{num_terms}}}): {last_term}",
+                    f"Sum of sequence (S_{{{num_terms}}}): {sequence_sum}",
+                    f"Average term: {average_term:.2f}",
+                    f"Range: {last_term - first_term}",
+                ]
+                st.markdown("**Calculated Values:**\n\n" + "\n".join(f"- {line}" for line in calculated_values))
             
         except Exception as e:
             st.error(f"An error occurred while generating the sequence: {str(e)}")